@@ -2,12 +2,9 @@
 ## Module with BfN to compute
 ### Version BETA
 
-from scipy.optimize import fsolve
-from scipy.optimize import least_squares
-from scipy.integrate import solve_ivp
+import scipy
 from numpy import diff
 import sys
-from scipy import special
 from betaPBH import constants
 from betaPBH import constraints
 import numpy as np
@@ -74,65 +71,64 @@ def get_betas_reh_tot(N_re, omega, gam_reh):
             return dy
         
         def diff_rad(ln_rho,initial,M,beta0):
-            dy = np.zeros(initial.shape)
             b = initial[0]
             time = initial[1]
             Delta_t = constants.t_pl*(M/constants.M_pl_g)**3
             Om_0 =  beta0*b*(1.-time/Delta_t)**(1./3)
-            dy[0] = -(Om_0-1.)*b/(Om_0-4.)
-            dy[1] = 3**(1./2)*constants.M_pl/((Om_0-4.)*np.exp(ln_rho)**(1./2))
-            return dy
+            dy0 = -(Om_0-1.)*b/(Om_0-4.)
+            dy1 = 3**(1./2)*constants.M_pl/((Om_0-4.)*np.exp(0.5*ln_rho))
+            # Build the output in one shot: allocating np.zeros and filling it
+            # element by element costs two passes over a tiny array per call
+            return np.array([dy0, dy1])
             
         def end_evol(ln_rho,initial,M,beta0):
             Delta_t = t_pl*(M/M_pl_g)**3
-            Mass_end = M*(1.-diff_rad(ln_rho,initial,M,beta0)[1]/Delta_t)**(1./3)
+            Mass_end = M*(1.-initial[1]/Delta_t)**(1./3)
             return Mass_end-M_pl_g
         
         def diff_ext_rel(ln_rho,initial,M,beta0,omega):
-            dy = np.zeros(initial.shape)
             b = initial[0]
             Om_ext = initial[1]
             Om_0 = beta0*b*(M_pl_g/M)
-            dy[0] = -(Om_0+(1-3*omega)*Om_ext-1.)*b/(Om_0+(1-3*omega)*Om_ext-4.)
-            dy[1] = -(Om_0+(1-3*omega)*Om_ext+3*omega-1)*Om_ext/(Om_0+(1-3*omega)*Om_ext-4)
-            return dy
+            dy0 = -(Om_0+(1-3*omega)*Om_ext-1.)*b/(Om_0+(1-3*omega)*Om_ext-4.)
+            dy1 = -(Om_0+(1-3*omega)*Om_ext+3*omega-1)*Om_ext/(Om_0+(1-3*omega)*Om_ext-4)
+            return np.array([dy0, dy1])
             
         def diff_ext(ln_rho,initial,M,beta0,omega):
-            dy = np.zeros(initial.shape)
             b = initial[0]
             time = initial[1]
             Om_ext = initial[2]
             Delta_t = t_pl*(M/M_pl_g)**3
             Om_0 =  beta0*b*(1.-time/Delta_t)**(1./3)
-            dy[0] = -(Om_0+(1-3*omega)*Om_ext-1.)*b/(Om_0+(1-3*omega)*Om_ext-4.)
-            dy[1] = 3**(1./2)*M_pl/((Om_0+(1-3*omega)*Om_ext-4.)*np.exp(ln_rho)**(1./2))
-            dy[2] = -(Om_0+(1-3*omega)*Om_ext+3*omega-1)*Om_ext/(Om_0+(1-3*omega)*Om_ext-4)
-            return dy
+            dy0 = -(Om_0+(1-3*omega)*Om_ext-1.)*b/(Om_0+(1-3*omega)*Om_ext-4.)
+            dy1 = 3**(1./2)*M_pl/((Om_0+(1-3*omega)*Om_ext-4.)*np.exp(0.5*ln_rho))
+            dy2 = -(Om_0+(1-3*omega)*Om_ext+3*omega-1)*Om_ext/(Om_0+(1-3*omega)*Om_ext-4)
+            return np.array([dy0, dy1, dy2])
             
         def end_evol_ext(ln_rho,initial,M,beta0,omega):
             Delta_t = t_pl*(M/M_pl_g)**3
-            Mass_end = M**(1.-diff_ext(ln_rho,initial,M,beta0,omega)[1]/Delta_t)**(1./3)
+            Mass_end = M**(1.-initial[1]/Delta_t)**(1./3)
             return Mass_end - M_pl_g
         
         def objective_reh(beta0):
             initial_reh = np.array([1.,0.,1.-beta0[0]])
-            sol_reh = solve_ivp(diff_ext,(ln_den_f,ln_den_end_reh),initial_reh,t_eval=ln_den_reh,args=(M,beta0[0],omega),method = "DOP853")
+            sol_reh = scipy.integrate.solve_ivp(diff_ext,(ln_den_f,ln_den_end_reh),initial_reh,t_eval=ln_den_reh,args=(M,beta0[0],omega),method = "DOP853")
             initial = np.array([sol_reh.y[0][-1],sol_reh.y[1][-1]])
-            sol = solve_ivp(diff_rad,(ln_den_end_reh,ln_den_end),initial,t_eval=ln_den,args=(M,beta0[0]),method = "DOP853")
+            sol = scipy.integrate.solve_ivp(diff_rad,(ln_den_end_reh,ln_den_end),initial,t_eval=ln_den,args=(M,beta0[0]),method = "DOP853")
             Delta_t = t_pl*(M/M_pl_g)**3
             y = beta0[0]*sol.y[0]*(1.-sol.y[1]/Delta_t)**(1./3)
             return y[-1]-end_value
         
         def objective_reh_rel(beta0):
             initial_reh = np.array([1.,0,1.-beta0[0]])
-            sol_reh = solve_ivp(diff_ext,(ln_den_f,ln_den_end_reh),initial_reh,events=end_evol_ext,t_eval=ln_den_reh,args=(M,beta0[0],omega),method = "DOP853")
+            sol_reh = scipy.integrate.solve_ivp(diff_ext,(ln_den_f,ln_den_end_reh),initial_reh,events=end_evol_ext,t_eval=ln_den_reh,args=(M,beta0[0],omega),method = "DOP853")
             if sol_reh.t[-1]>ln_den_end_reh:
                 initial_reh2 = np.array([sol_reh.y[0][-1],1.-beta0[0]*sol_reh.y[0][-1]])
                 ln_den_reh2 = np.linspace(sol_reh.t[-1],ln_den_end_reh,10000)
-                sol_reh = solve_ivp(diff_ext_rel,(sol_reh.t[-1],ln_den_end_reh),initial_reh2,t_eval=ln_den_reh2,args=(M,beta0[0],omega),method = "DOP853")
+                sol_reh = scipy.integrate.solve_ivp(diff_ext_rel,(sol_reh.t[-1],ln_den_end_reh),initial_reh2,t_eval=ln_den_reh2,args=(M,beta0[0],omega),method = "DOP853")
             initial = np.array([sol_reh.y[0][-1]])
             ln_den = np.linspace(sol_reh.t[-1],ln_den_end,10000)
-            sol = solve_ivp(diff_rad_rel,(sol_reh.t[-1],ln_den_end),initial,t_eval=ln_den,args=(M,beta0[0]),method = "DOP853")
+            sol = scipy.integrate.solve_ivp(diff_rad_rel,(sol_reh.t[-1],ln_den_end),initial,t_eval=ln_den,args=(M,beta0[0]),method = "DOP853")
             y = beta0[0]*sol.y[0]*(M_pl_g/M)
             return y[-1]-end_value
     
@@ -147,13 +143,13 @@ def get_betas_reh_tot(N_re, omega, gam_reh):
         ln_den = np.linspace(ln_den_end_reh,ln_den_end,10000)
 
         # Solve the differential equation using solve_ivp
-        sol1_try = solve_ivp(diff_ext,(ln_den_f,ln_den_end_reh),np.array([1.,0.,1-1e-5]),events=end_evol_ext,t_eval=ln_den_reh,args=(M,1e-5,omega),method = "DOP853")
+        sol1_try = scipy.integrate.solve_ivp(diff_ext,(ln_den_f,ln_den_end_reh),np.array([1.,0.,1-1e-5]),events=end_evol_ext,t_eval=ln_den_reh,args=(M,1e-5,omega),method = "DOP853")
 
         # Check if the end of the integration is greater than ln_den_end_reh
         if sol1_try.t[-1] > ln_den_end_reh:
             t = sol1_try.t[-1]
         else:
-            sol2_try = solve_ivp(diff_ext,(ln_den_end_reh,ln_den_end),np.array([1e-5*sol1_try.y[0][-1],sol1_try.y[1][-1],0]),events=end_evol_ext,t_eval=ln_den,args=(M,1e-5,0),method = "DOP853")
+            sol2_try = scipy.integrate.solve_ivp(diff_ext,(ln_den_end_reh,ln_den_end),np.array([1e-5*sol1_try.y[0][-1],sol1_try.y[1][-1],0]),events=end_evol_ext,t_eval=ln_den,args=(M,1e-5,0),method = "DOP853")
             t = sol2_try.t[-1]
 
         # Check if the end of the integration is greater than ln_den_end
@@ -163,11 +159,11 @@ def get_betas_reh_tot(N_re, omega, gam_reh):
                 betas_reh_tot.append(1)
                 continue
             else:
-                beta0, = fsolve(objective_reh_rel,beta_try)
+                beta0, = scipy.optimize.fsolve(objective_reh_rel,beta_try)
                 betas_reh_tot.append(beta0)
         else:
             beta_try = Omegas_full[i]/(1+(rho_end_reh/rho_end)**(1./4))
-            beta0, = fsolve(objective_reh,beta_try)#,xtol=1e-5)
+            beta0, = scipy.optimize.fsolve(objective_reh,beta_try)#,xtol=1e-5)
             betas_reh_tot.append(beta0)
             
     return betas_reh_tot
@@ -2,12 +2,9 @@
 ## Module with BfS to compute
 ### Version BETA
 
-from scipy.optimize import fsolve
-from scipy.optimize import least_squares
-from scipy.integrate import solve_ivp
+import scipy
 from numpy import diff
 import sys
-from scipy import special
 from betaPBH import constants
 from betaPBH import constraints
 import numpy as np
@@ -66,29 +63,27 @@ def get_betas_stiff_tot(N_stiff, omega, gam_stiff):
         ln_den_f = np.log(rho_form_stiff[i])
         
         def diff_ext_rel(ln_rho,initial,M,beta0,omega):
-            dy = np.zeros(initial.shape)
             b = initial[0]
             Om_ext = initial[1]
             Om_0 = beta0*b*(M_pl_g/M)
-            dy[0] = -(Om_0+(1-3*omega)*Om_ext-1.)*b/(Om_0+(1-3*omega)*Om_ext-4.)
-            dy[1] = -(Om_0+(1-3*omega)*Om_ext+3*omega-1)*Om_ext/(Om_0+(1-3*omega)*Om_ext-4)
-            return dy
+            dy0 = -(Om_0+(1-3*omega)*Om_ext-1.)*b/(Om_0+(1-3*omega)*Om_ext-4.)
+            dy1 = -(Om_0+(1-3*omega)*Om_ext+3*omega-1)*Om_ext/(Om_0+(1-3*omega)*Om_ext-4)
+            return np.array([dy0, dy1])
         
         def diff_ext(ln_rho,initial,M,beta0,omega):
-            dy = np.zeros(initial.shape)
             b = initial[0]
             time = initial[1]
             Om_ext = initial[2]
             Delta_t = t_pl*(M/M_pl_g)**3
             Om_0 =  beta0*b*(1.-time/Delta_t)**(1./3)
-            dy[0] = -(Om_0+(1-3*omega)*Om_ext-1.)*b/(Om_0+(1-3*omega)*Om_ext-4.)
-            dy[1] = 3**(1./2)*M_pl/((Om_0+(1-3*omega)*Om_ext-4.)*np.exp(ln_rho)**(1./2))
-            dy[2] = -(Om_0+(1-3*omega)*Om_ext+3*omega-1)*Om_ext/(Om_0+(1-3*omega)*Om_ext-4)
-            return dy
+            dy0 = -(Om_0+(1-3*omega)*Om_ext-1.)*b/(Om_0+(1-3*omega)*Om_ext-4.)
+            dy1 = 3**(1./2)*M_pl/((Om_0+(1-3*omega)*Om_ext-4.)*np.exp(0.5*ln_rho))
+            dy2 = -(Om_0+(1-3*omega)*Om_ext+3*omega-1)*Om_ext/(Om_0+(1-3*omega)*Om_ext-4)
+            return np.array([dy0, dy1, dy2])
         
         def end_evol_ext(ln_rho,initial,M,beta0,omega):
             Delta_t = t_pl*(M/M_pl_g)**3
-            Mass_end = M**(1.-diff_ext(ln_rho,initial,M,beta0,omega)[1]/Delta_t)**(1./3)
+            Mass_end = M**(1.-initial[1]/Delta_t)**(1./3)
             return Mass_end - M_pl_g
         
         def objective_stiff(beta0):
@@ -96,7 +91,7 @@ def get_betas_stiff_tot(N_stiff, omega, gam_stiff):
             initial_stiff = np.array([1.,0.,(1.-beta0[0]*(1+np.exp(N_f)))/(1+np.exp(-2*N_f))])
             if initial_stiff[1]<1/2:
                 initial_stiff[1] = 1/2
-            sol = solve_ivp(diff_ext,(ln_den_f,ln_den_end),initial_stiff,t_eval=ln_den,args=(M,beta0[0],omega),method = "DOP853")
+            sol = scipy.integrate.solve_ivp(diff_ext,(ln_den_f,ln_den_end),initial_stiff,t_eval=ln_den,args=(M,beta0[0],omega),method = "DOP853")
             Delta_t = t_pl*(M/M_pl_g)**3
             y = beta0[0]*sol.y[0]*(1.-sol.y[1]/Delta_t)**(1./3)
             return y[-1]-end_value
@@ -104,7 +99,7 @@ def get_betas_stiff_tot(N_stiff, omega, gam_stiff):
         def objective_stiff_rel(beta0):
             N_f = (1/6)*(ln_den_f-ln_den_end_stiff)
             initial_stiff = np.array([1.,(1.-(M_pl_g/M)*beta0[0]*(1+np.exp(N_f)))/(1+np.exp(-2*N_f))])
-            sol = solve_ivp(diff_ext_rel,(ln_den_f,ln_den_end),initial_stiff,t_eval=ln_den,args=(M,beta0[0],omega),method = "DOP853")#
+            sol = scipy.integrate.solve_ivp(diff_ext_rel,(ln_den_f,ln_den_end),initial_stiff,t_eval=ln_den,args=(M,beta0[0],omega),method = "DOP853")#
             y = beta0[0]*sol.y[0]*(M_pl_g/M)
             return y[-1]-end_value
         
@@ -112,17 +107,17 @@ def get_betas_stiff_tot(N_stiff, omega, gam_stiff):
             betas_stiff.append(betas_full[i])
             continue
         ln_den = np.linspace(ln_den_f, ln_den_end, 10000)
-        sol_try = solve_ivp(diff_ext, (ln_den_f, ln_den_end), np.array([1., 0., (1-1e-10)/(1+np.exp(-2*N_stiff)/0.1)]), events=end_evol_ext, t_eval=ln_den, args=(M, 1e-10, omega), method="DOP853")
+        sol_try = scipy.integrate.solve_ivp(diff_ext, (ln_den_f, ln_den_end), np.array([1., 0., (1-1e-10)/(1+np.exp(-2*N_stiff)/0.1)]), events=end_evol_ext, t_eval=ln_den, args=(M, 1e-10, omega), method="DOP853")
         if sol_try.t[-1] > ln_den_end:
             beta_try = 2*Omegas_full[i]*(M/M_pl_g)/(1+np.sqrt(rho_form_stiff[i]/(rho_end_stiff))*(rho_end_stiff/rho_end)**(1/4))
-            beta0, = fsolve(objective_stiff_rel, beta_try)
+            beta0, = scipy.optimize.fsolve(objective_stiff_rel, beta_try)
             if (beta0/beta_try > 10000):
                 betas_stiff.append(beta_try)
             else:
                 betas_stiff.append(beta0)
         else:
             beta_try = 1e-4*Omegas_full[i]/(1+np.sqrt(rho_form_stiff[i]/(rho_end_stiff))*(rho_end_stiff/rho_end)**(1/4))
-            beta0, = fsolve(objective_stiff, beta_try)
+            beta0, = scipy.optimize.fsolve(objective_stiff, beta_try)
             betas_stiff.append(beta0)
     return betas_stiff
 
@@ -1,46 +1,98 @@
-from .functions import diff_rad_rel
-from .functions import diff_rad
-from .functions import end_evol
-from .functions import k_end_over_k
-from .functions import rho_f
-from .functions import Betas_DM
-from .functions import Betas_BBN
-from .functions import Betas_SD
-from .functions import Betas_CMB_AN
-from .functions import Betas_GRB
-from .functions import Betas_Reio
-from .functions import Betas_LSP
-from .functions import Omegas_LSP
-from .functions import get_Betas_full
-from .functions import put_M_array
-
-from .constants import t_pl_s
-from .constants import s_to_evm1
-from .constants import M_pl
-from .constants import M_pl_g
-from .constants import grams_to_solar_mass
-from .constants import gam_rad
-from .constants import H_end
-from .constants import rho_end
-from .constants import ev1
-from .constants import ev2
-
-from .constraints import data_mass
-from .constraints import data_abundances
-from .constraints import data_beta_full
-from .constraints import data_Omegas_full
-from .constraints import data_M_tot
-from .constraints import betas_DM_tot
-from .constraints import betas_BBN_tot
-from .constraints import betas_SD_tot
-from .constraints import betas_GRB_tot
-from .constraints import betas_CMB_AN_tot
-from .constraints import betas_Reio_tot
-from .constraints import betas_LSP_tot
-from .constraints import betas_full
-from .constraints import Omegas_full
-from .constraints import M_tot
-
-from .BfN import get_betas_reh_tot
-
-from .BfS import get_betas_stiff_tot
+# File: __init__.py
+## Lazy public namespace of the package (PEP 562)
+### Version BETA
+
+import importlib
+
+# Map every public name to the submodule that defines it. The submodule is
+# only imported on first attribute access, so `import betaPBH` no longer pays
+# the scipy (and, when installed, numba) import cost up front; a workflow
+# that only touches the constants or the tabulated constraints never pays
+# it at all.
+_SUBMODULE_BY_NAME = {}
+
+for _name in (
+    'diff_rad_rel',
+    'diff_rad',
+    'end_evol',
+    'k_end_over_k',
+    'rho_f',
+    'Betas_DM',
+    'Betas_BBN',
+    'Betas_SD',
+    'Betas_CMB_AN',
+    'Betas_GRB',
+    'Betas_Reio',
+    'Betas_LSP',
+    'Omegas_LSP',
+    'get_Betas_full',
+    'put_M_array',
+):
+    _SUBMODULE_BY_NAME[_name] = 'functions'
+
+for _name in (
+    't_pl_s',
+    's_to_evm1',
+    'M_pl',
+    'M_pl_g',
+    'grams_to_solar_mass',
+    'gam_rad',
+    'H_end',
+    'rho_end',
+    'ev1',
+    'ev2',
+):
+    _SUBMODULE_BY_NAME[_name] = 'constants'
+
+for _name in (
+    'data_mass',
+    'data_abundances',
+    'data_beta_full',
+    'data_Omegas_full',
+    'data_M_tot',
+    'betas_DM_tot',
+    'betas_BBN_tot',
+    'betas_SD_tot',
+    'betas_GRB_tot',
+    'betas_CMB_AN_tot',
+    'betas_Reio_tot',
+    'betas_LSP_tot',
+    'betas_full',
+    'Omegas_full',
+    'M_tot',
+):
+    _SUBMODULE_BY_NAME[_name] = 'constraints'
+
+_SUBMODULE_BY_NAME['get_betas_reh_tot'] = 'BfN'
+_SUBMODULE_BY_NAME['get_betas_stiff_tot'] = 'BfS'
+
+del _name
+
+# The submodules themselves are part of the public namespace too, as in
+# `betaPBH.functions.put_M_array` from the docs; they load on first access
+# just like the flat names
+_SUBMODULES = ('functions', 'constants', 'constraints', 'BfN', 'BfS')
+
+__all__ = sorted(set(_SUBMODULE_BY_NAME) | set(_SUBMODULES))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        # importlib sets the attribute on the package, so this also only
+        # runs once per submodule
+        return importlib.import_module('.' + name, __name__)
+    try:
+        submodule_name = _SUBMODULE_BY_NAME[name]
+    except KeyError:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+    submodule = importlib.import_module('.' + submodule_name, __name__)
+    value = getattr(submodule, name)
+    # Cache the resolved value so the lookup only happens once, matching the
+    # behaviour of the old eager `from .submodule import name` lines
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(__all__) | set(globals()))
@@ -0,0 +1,193 @@
+# File: _integrator.py
+## Compiled endpoint-only driver for the radiation-era evolution
+### Version BETA
+
+import math
+from betaPBH import constants
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # numba is optional: without it functions.py keeps using scipy's
+    # solve_ivp, so the drivers below are never called.
+    HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        def wrapper(func):
+            return func
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return wrapper
+
+# Set the values of the variables as plain floats for the compiled drivers
+M_pl = constants.M_pl # define M_pl
+M_pl_g = constants.M_pl_g # define M_pl_g
+t_pl = constants.t_pl # define t_pl
+
+# Dormand-Prince 5(4) tableau (the pair behind scipy's RK45); written out as
+# plain floats so the compiled stepper carries no array state
+_C2, _C3, _C4, _C5 = 1./5, 3./10, 4./5, 8./9
+_A21 = 1./5
+_A31, _A32 = 3./40, 9./40
+_A41, _A42, _A43 = 44./45, -56./15, 32./9
+_A51, _A52, _A53, _A54 = 19372./6561, -25360./2187, 64448./6561, -212./729
+_A61, _A62, _A63, _A64, _A65 = 9017./3168, -355./33, 46732./5247, 49./176, -5103./18656
+_B1, _B3, _B4, _B5, _B6 = 35./384, 500./1113, 125./192, -2187./6784, 11./84
+_E1, _E3, _E4, _E5, _E6, _E7 = 71./57600, -71./16695, 71./1920, -17253./339200, 22./525, -1./40
+
+# Default tolerances, matching scipy.integrate.solve_ivp
+_RTOL = 1e-3
+_ATOL = 1e-6
+
+
+@njit(cache=True)
+def _rhs_rad(ln_rho, b, time, Delta_t, beta0):
+    """Right-hand side of the (b, time) radiation-era system; scalar twin of functions.diff_rad. Delta_t is precomputed by the driver."""
+    Om_0 = beta0 * b * (1. - time / Delta_t) ** (1. / 3)
+    db = -(Om_0 - 1.) * b / (Om_0 - 4.)
+    dtime = 3 ** (1. / 2) * M_pl / ((Om_0 - 4.) * math.exp(0.5 * ln_rho))
+    return db, dtime
+
+
+@njit(cache=True)
+def _rhs_rad_rel(ln_rho, b, M, beta0):
+    """Right-hand side of the relativistic (Planck-relic) system; scalar twin of functions.diff_rad_rel."""
+    Om_0 = beta0 * b * (M_pl_g / M)
+    return -(Om_0 - 1.) * b / (Om_0 - 4.)
+
+
+@njit(cache=True)
+def integrate_rad(M, beta0, ln_den_f, ln_den_end, rtol=_RTOL, atol=_ATOL):
+    """
+    Integrates the (b, time) radiation-era system from ln_den_f down to ln_den_end.
+
+    Parameters:
+        - M (float): The mass of the PBH, in grams.
+        - beta0 (float): The beta parameter value.
+        - ln_den_f (float): Log of the formation density (start of the integration).
+        - ln_den_end (float): Log of the density at the end of the integration.
+        - rtol, atol (float): Local error tolerances of the adaptive stepper.
+
+    Returns:
+        A tuple (b_end, time_end, reached_end):
+            - b_end (float): The scale factor b at the last accepted step.
+            - time_end (float): The elapsed time at the last accepted step.
+            - reached_end (bool): False when the step size underflows before
+              ln_den_end, i.e. the PBH evaporates during the integration
+              (the same condition that makes solve_ivp fail on this system).
+
+    Notes:
+        - The stepper is the embedded Dormand-Prince 5(4) pair with the
+          standard error-based step control, fully compiled with numba, so
+          the whole integration runs without entering the Python interpreter.
+        - Only the endpoint is produced; no dense output is evaluated.
+    """
+    Delta_t = t_pl * (M / M_pl_g) ** 3  # hoisted: invariant over the whole integration
+    t = ln_den_f
+    b = 1.
+    time = 0.
+    span = ln_den_end - ln_den_f  # negative: density decreases
+    h = span / 100.
+
+    k1b, k1t = _rhs_rad(t, b, time, Delta_t, beta0)
+
+    for _ in range(1000000):
+        if t <= ln_den_end:
+            return b, time, True
+        if t + h < ln_den_end:
+            h = ln_den_end - t
+        if abs(h) < 1e-13 * max(1., abs(t)):
+            return b, time, False
+
+        k2b, k2t = _rhs_rad(t + _C2 * h, b + h * _A21 * k1b,
+                            time + h * _A21 * k1t, Delta_t, beta0)
+        k3b, k3t = _rhs_rad(t + _C3 * h, b + h * (_A31 * k1b + _A32 * k2b),
+                            time + h * (_A31 * k1t + _A32 * k2t), Delta_t, beta0)
+        k4b, k4t = _rhs_rad(t + _C4 * h, b + h * (_A41 * k1b + _A42 * k2b + _A43 * k3b),
+                            time + h * (_A41 * k1t + _A42 * k2t + _A43 * k3t), Delta_t, beta0)
+        k5b, k5t = _rhs_rad(t + _C5 * h, b + h * (_A51 * k1b + _A52 * k2b + _A53 * k3b + _A54 * k4b),
+                            time + h * (_A51 * k1t + _A52 * k2t + _A53 * k3t + _A54 * k4t), Delta_t, beta0)
+        k6b, k6t = _rhs_rad(t + h, b + h * (_A61 * k1b + _A62 * k2b + _A63 * k3b + _A64 * k4b + _A65 * k5b),
+                            time + h * (_A61 * k1t + _A62 * k2t + _A63 * k3t + _A64 * k4t + _A65 * k5t), Delta_t, beta0)
+
+        b_new = b + h * (_B1 * k1b + _B3 * k3b + _B4 * k4b + _B5 * k5b + _B6 * k6b)
+        time_new = time + h * (_B1 * k1t + _B3 * k3t + _B4 * k4t + _B5 * k5t + _B6 * k6t)
+        k7b, k7t = _rhs_rad(t + h, b_new, time_new, Delta_t, beta0)
+
+        err_b = h * (_E1 * k1b + _E3 * k3b + _E4 * k4b + _E5 * k5b + _E6 * k6b + _E7 * k7b)
+        err_t = h * (_E1 * k1t + _E3 * k3t + _E4 * k4t + _E5 * k5t + _E6 * k6t + _E7 * k7t)
+        scale_b = atol + rtol * max(abs(b), abs(b_new))
+        scale_t = atol + rtol * max(abs(time), abs(time_new))
+        err = math.sqrt(0.5 * ((err_b / scale_b) ** 2 + (err_t / scale_t) ** 2))
+
+        if err <= 1.:
+            t = t + h
+            b = b_new
+            time = time_new
+            k1b, k1t = k7b, k7t  # FSAL: last stage is the next first stage
+            factor = 10. if err == 0. else min(10., 0.9 * err ** -0.2)
+            h = h * factor
+        else:
+            # err > 1 or NaN (e.g. the PBH mass went below the Planck mass):
+            # reject the step and retry with a smaller one; k1 is still valid
+            h = h * max(0.2, 0.9 * err ** -0.2) if err == err else h * 0.2
+
+    return b, time, False
+
+
+@njit(cache=True)
+def integrate_rad_rel(M, beta0, ln_den_f, ln_den_end, rtol=_RTOL, atol=_ATOL):
+    """
+    Integrates the one-dimensional relativistic system from ln_den_f down to ln_den_end.
+
+    Parameters:
+        - M (float): The mass of the PBH, in grams.
+        - beta0 (float): The beta parameter value.
+        - ln_den_f (float): Log of the formation density (start of the integration).
+        - ln_den_end (float): Log of the density at the end of the integration.
+        - rtol, atol (float): Local error tolerances of the adaptive stepper.
+
+    Returns:
+        - b_end (float): The scale factor b at ln_den_end.
+
+    Notes:
+        - Same Dormand-Prince 5(4) stepper as integrate_rad, specialized to
+          the single-variable system used after a PBH has evaporated.
+    """
+    t = ln_den_f
+    b = 1.
+    h = (ln_den_end - ln_den_f) / 100.
+
+    k1 = _rhs_rad_rel(t, b, M, beta0)
+
+    for _ in range(1000000):
+        if t <= ln_den_end:
+            return b
+        if t + h < ln_den_end:
+            h = ln_den_end - t
+        if abs(h) < 1e-13 * max(1., abs(t)):
+            return b
+
+        k2 = _rhs_rad_rel(t + _C2 * h, b + h * _A21 * k1, M, beta0)
+        k3 = _rhs_rad_rel(t + _C3 * h, b + h * (_A31 * k1 + _A32 * k2), M, beta0)
+        k4 = _rhs_rad_rel(t + _C4 * h, b + h * (_A41 * k1 + _A42 * k2 + _A43 * k3), M, beta0)
+        k5 = _rhs_rad_rel(t + _C5 * h, b + h * (_A51 * k1 + _A52 * k2 + _A53 * k3 + _A54 * k4), M, beta0)
+        k6 = _rhs_rad_rel(t + h, b + h * (_A61 * k1 + _A62 * k2 + _A63 * k3 + _A64 * k4 + _A65 * k5), M, beta0)
+
+        b_new = b + h * (_B1 * k1 + _B3 * k3 + _B4 * k4 + _B5 * k5 + _B6 * k6)
+        k7 = _rhs_rad_rel(t + h, b_new, M, beta0)
+
+        err_raw = h * (_E1 * k1 + _E3 * k3 + _E4 * k4 + _E5 * k5 + _E6 * k6 + _E7 * k7)
+        scale = atol + rtol * max(abs(b), abs(b_new))
+        err = abs(err_raw / scale)
+
+        if err <= 1.:
+            t = t + h
+            b = b_new
+            k1 = k7
+            factor = 10. if err == 0. else min(10., 0.9 * err ** -0.2)
+            h = h * factor
+        else:
+            h = h * max(0.2, 0.9 * err ** -0.2) if err == err else h * 0.2
+
+    return b
@@ -2,16 +2,55 @@
 ## Module with functions
 ### Version BETA
 
-from scipy.optimize import fsolve
-from scipy.optimize import least_squares
-from scipy.integrate import solve_ivp
+import scipy
 from numpy import diff
 import sys
-from scipy import special
+import math
+import multiprocessing
+import functools
 from betaPBH import constants
 from betaPBH import constraints
+from betaPBH import _integrator
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: without it the right-hand sides below run as plain
+    # Python functions, with identical results.
+    def njit(*args, **kwargs):
+        def wrapper(func):
+            return func
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return wrapper
+
+# Set the values of the variables as plain floats, so that the jitted
+# right-hand sides close over compile-time constants instead of looking up
+# module attributes on every evaluation
+M_pl = constants.M_pl # define M_pl
+M_pl_g = constants.M_pl_g # define M_pl_g
+t_pl = constants.t_pl # define t_pl
+
+# Mass windows of the observational constraints, precomputed once as module
+# floats so the masks below compare against ready-made constants instead of
+# rebuilding 10**N expressions on every call. _M_PRIM keeps the 4.1*10**14
+# spelling: the literal 4.1e14 differs from it in the last ulp.
+_M_PRIM = 4.1*10**14 # primordial / extragalactic photon boundary, in grams
+_M_RELIC_HI = 1e11*constants.M_pl_g # upper edge of the Planck-relic window
+_M_BBN_LO = constraints.data_mass[0] # lower edge of the tabulated BBN window
+_M_BBN_HI = constraints.data_mass[76] # upper edge of the tabulated BBN window
+_M_PBBN_HI = 2.5e13 # upper edge of the post-BBN window
+_M_SD_LO = 1e11 # spectral-distortion window
+_M_SD_HI = 1e13
+_M_AN_LO = 2.5e13 # CMB-anisotropy window
+_M_AN_HI = 2.4e14
+_M_GRB_LO = 3e13 # gamma-ray background window
+_M_GRB_HI = 7e16
+_M_REIO_LO = 1e15 # reionization window
+_M_REIO_HI = 1e17
+_M_LSP_HI = 1e11 # upper edge of the LSP window
+
 def put_M_array(delta_M):
     """
     This function generates an array of masses from 1e-3 solar masses to 1e20 solar masses with a given resolution.
@@ -22,32 +61,26 @@ def put_M_array(delta_M):
     Returns:
     M_tot (ndarray): Array of masses.
     """
-    # Initialize the variables
-    i = 0
-    M = 0
-
-    # Calculate the total mass with given constraints
-    while M < constraints.data_mass[0]:
-        M = 10**(i*delta_M)
-        constraints.M_tot.append(M)
-        i = i+1
+    data_mass = np.asarray(constraints.data_mass, dtype=np.float64)
 
-    # Append data_mass to the constraints.M_tot array
-    constraints.M_tot = np.concatenate((constraints.M_tot, constraints.data_mass))
-    M = constraints.M_tot[-1]
+    # Masses below the tabulated window: 10**(i*delta_M), up to and including
+    # the first point at or above data_mass[0]
+    n_lo = int(np.ceil(np.log10(data_mass[0])/delta_M)) + 1
+    lo = 10**(np.arange(n_lo)*delta_M)
 
-    # Calculate the masses until it reaches 10^20
-    A = M
-    j = 0
+    # Masses above the tabulated window: data_mass[-1]*10**(j*delta_M), up to
+    # and including the first point at or above 10^20
+    n_hi = int(np.ceil((20 - np.log10(data_mass[-1]))/delta_M))
+    hi = data_mass[-1]*10**(np.arange(1, n_hi+1)*delta_M)
 
-    while M < 10**20:
-        j = j+1
-        M = A*10**(j*delta_M)
-        constraints.M_tot = np.append(constraints.M_tot,[M])
+    # Single allocation: the old per-element np.append grew the array by
+    # one slot at a time, copying everything already accumulated on each step
+    constraints.M_tot = np.concatenate((lo, data_mass, hi))
 
     return constraints.M_tot
 
 
+@njit(cache=True)
 def diff_rad_rel(ln_rho,initial,M,beta0):
     """
     Calculates the derivative of the scale factor for the radiation-dominated era, assuming a dark matter particle with mass M
@@ -66,11 +99,12 @@ def diff_rad_rel(ln_rho,initial,M,beta0):
         - This function calculates the derivative of the scale factor b for the radiation-dominated era, using the formula:
           dy/dln(a) = -(Om_0 - 1) * b / (Om_0 - 4), where Om_0 = beta0 * b * (M_pl / M).
         - Here, M_pl is the Planck mass, defined as sqrt(hbar*c/G), where hbar is the reduced Planck constant, c is the speed of light, and G is the gravitational constant.
+        - The function is compiled with numba (when available), so that solve_ivp does not pay the Python dispatch cost on every evaluation.
     """
 
     # Extract initial scale factor b and calculate Om_0
     b = initial[0]
-    Om_0 = beta0 * b * (constants.M_pl_g / M)
+    Om_0 = beta0 * b * (M_pl_g / M)
 
     # Calculate the derivative of the scale factor b
     dy = -(Om_0 - 1.) * b / (Om_0 - 4.)
@@ -78,7 +112,8 @@ def diff_rad_rel(ln_rho,initial,M,beta0):
     return dy
 
 
-def diff_rad(ln_rho,initial,M,beta0):
+@njit(cache=True)
+def diff_rad(ln_rho,initial,M,beta0,Delta_t):
     """
     Calculates the derivative of the scale factor b and the time derivative of the density of radiation for a given dark matter particle mass.
 
@@ -87,6 +122,7 @@ def diff_rad(ln_rho,initial,M,beta0):
         - initial (numpy.ndarray): An array containing the initial values of the scale factor b and time.
         - M (float): The mass of the dark matter particle, in units of solar masses.
         - beta0 (float): The initial value of the beta parameter.
+        - Delta_t (float): The evaporation time t_pl*(M/M_pl_g)**3, computed once by the caller so that it is not rebuilt on every evaluation.
 
     Returns:
         - dy (numpy.ndarray): An array containing the derivatives of the scale factor b and the density of radiation with respect to time.
@@ -94,26 +130,24 @@ def diff_rad(ln_rho,initial,M,beta0):
     Notes:
         - The function calculates the derivative of the scale factor b and the time derivative of the density of radiation for a given dark matter particle mass using the initial conditions and the beta parameter value.
         - The function assumes a radiation-dominated universe.
+        - The function is compiled with numba (when available), so that solve_ivp does not pay the Python dispatch cost on every evaluation.
     """
-    # Initialize dy array
-    dy = np.zeros(initial.shape)
-
     # Extract initial values of scale factor b and time
     b = initial[0]
     time = initial[1]
 
-    # Calculate Delta_t and Om_0
-    Delta_t = constants.t_pl * (M / constants.M_pl_g) ** 3
+    # Calculate Om_0 from the precomputed Delta_t
     Om_0 = beta0 * b * (1. - time / Delta_t) ** (1. / 3)
 
     # Calculate the derivative of the scale factor b and the time derivative of the density of radiation
-    dy[0] = -(Om_0 - 1.) * b / (Om_0 - 4.)
-    dy[1] = 3 ** (1. / 2) * constants.M_pl / ((Om_0 - 4.) * np.exp(ln_rho) ** (1. / 2))
+    dy0 = -(Om_0 - 1.) * b / (Om_0 - 4.)
+    dy1 = 3 ** (1. / 2) * M_pl / ((Om_0 - 4.) * math.exp(0.5 * ln_rho))
 
-    return dy
+    return np.array([dy0, dy1])
 
 
-def end_evol(ln_rho,initial,M,beta0):
+@njit(cache=True)
+def end_evol(ln_rho,initial,M,beta0,Delta_t):
     """
     Calculates the difference between the final mass of a dark matter system and the Planck mass.
 
@@ -122,6 +156,7 @@ def end_evol(ln_rho,initial,M,beta0):
         - initial (numpy.ndarray): The initial values of the scale factor and time, given as a numpy array with shape (2,).
         - M (float): The total mass of the dark matter system, in units of solar masses.
         - beta0 (float): The initial value of the beta parameter.
+        - Delta_t (float): The evaporation time t_pl*(M/M_pl_g)**3, computed once by the caller.
 
     Returns:
         - float: The difference between the final mass of the dark matter system and the Planck mass.
@@ -129,12 +164,13 @@ def end_evol(ln_rho,initial,M,beta0):
     Notes:
         - The function calculates the difference between the final mass of a dark matter system and the Planck mass by calculating the mass evolution of the system as a function of time and radiation density, and then solving for the time when the mass of the system becomes equal to the Planck mass.
     """
-    # Calculate Delta_t and Mass_end
-    Delta_t = constants.t_pl * (M / constants.M_pl_g) ** 3
-    Mass_end = M * (1. - diff_rad(ln_rho,initial,M,beta0)[1] / Delta_t) ** (1. / 3)
+    # Calculate Mass_end from the precomputed Delta_t. The elapsed time is
+    # initial[1] itself; the old code re-evaluated diff_rad and used the time
+    # *derivative* here, doubling the RHS cost of every event evaluation
+    Mass_end = M * (1. - initial[1] / Delta_t) ** (1. / 3)
 
     # Return the difference between the final mass of a system and the Planck mass
-    return Mass_end - constants.M_pl_g
+    return Mass_end - M_pl_g
 
 
 def k_end_over_k(Mpbh, omega):
@@ -189,10 +225,144 @@ def rho_f(Mpbh, omega):
 ####calcular betas es una funcion que unicamente debe
 ####depender de la masa
 
-ln_den_end = np.log(constants.rho_end)
+
+def _integrate_endpoint(M, beta0, ln_den_f, ln_den_end, rtol=1e-3, atol=1e-6):
+    """
+    Integrates the (b, time) radiation-era system from ln_den_f down to ln_den_end and returns the endpoint only.
+
+    Parameters:
+        - M (float): The mass of the PBH, in grams.
+        - beta0 (float): The beta parameter value.
+        - ln_den_f (float): Log of the formation density.
+        - ln_den_end (float): Log of the density at the end of the integration.
+        - rtol, atol (float): Local error tolerances; the defaults match scipy's solve_ivp.
+
+    Returns:
+        A tuple (b_end, time_end, reached_end):
+            - b_end, time_end (float): The state at the last point reached.
+            - reached_end (bool): False when the integration fails before
+              ln_den_end, i.e. the PBH evaporates down to the Planck mass.
+
+    Notes:
+        - When numba is available the whole integration runs in the compiled
+          driver of the _integrator module; otherwise it falls back to
+          scipy's solve_ivp with the same semantics.
+        - No analytic Jacobian is supplied: both paths are explicit
+          Runge-Kutta methods, which never evaluate one. A jac= argument
+          would only pay off with an implicit method (Radau/BDF/LSODA),
+          and those silently integrate through the evaporation singularity
+          this pipeline relies on detecting.
+    """
+    if _integrator.HAVE_NUMBA:
+        return _integrator.integrate_rad(M, beta0, ln_den_f, ln_den_end, rtol, atol)
+    # Hoist the evaporation time out of the RHS: it only depends on M
+    Delta_t = t_pl * (M / M_pl_g) ** 3
+    sol_try = scipy.integrate.solve_ivp(diff_rad,(ln_den_f,ln_den_end),np.array([1.,0.]),events=end_evol,args=(M,beta0,Delta_t),method = "DOP853",rtol = rtol,atol = atol)
+    return sol_try.y[0][-1], sol_try.y[1][-1], sol_try.status == 0
+
+
+def _integrate_endpoint_rel(M, beta0, ln_den_f, ln_den_end, rtol=1e-3, atol=1e-6):
+    """
+    Integrates the relativistic one-variable system from ln_den_f down to ln_den_end and returns the final scale factor b.
+
+    Used for PBHs that evaporate before BBN; see _integrate_endpoint for the
+    numba/scipy dispatch.
+    """
+    if _integrator.HAVE_NUMBA:
+        return _integrator.integrate_rad_rel(M, beta0, ln_den_f, ln_den_end, rtol, atol)
+    sol_try = scipy.integrate.solve_ivp(diff_rad_rel,(ln_den_f,ln_den_end),np.array([1.]),args=(M,beta0),method = "DOP853",rtol = rtol,atol = atol)
+    return sol_try.y[0][-1]
+
+
+def _one_mass(task, rtol=1e-3, atol=1e-6):
+    """
+    Integrates a single (M, beta) pair and returns its relic abundance.
+
+    Parameters:
+        - task (tuple): (M, beta, ln_den_f, ln_den_end, allow_rel), where
+          allow_rel enables the relativistic fallback for PBHs that
+          evaporate before reaching ln_den_end.
+        - rtol, atol (float): Local error tolerances of the integration.
+
+    Returns:
+        A tuple (y, went_rel):
+            - y (float): The relic abundance contribution of this mass.
+            - went_rel (bool): True when the relativistic fallback was used.
+
+    Notes:
+        - The task is a flat tuple of picklable scalars so that the function
+          can be mapped over a multiprocessing pool.
+    """
+    M, beta, ln_den_f, ln_den_end, allow_rel = task
+    b_end, time_end, reached_end = _integrate_endpoint(M, beta, ln_den_f, ln_den_end, rtol, atol)
+    if allow_rel and not reached_end:
+        b_rel = _integrate_endpoint_rel(M, beta, ln_den_f, ln_den_end, rtol, atol)
+        return beta*b_rel*(constants.M_pl_g/M), True
+    Delta_t = constants.t_pl*(M/constants.M_pl_g)**3
+    return beta*b_end*(1.-time_end/Delta_t)**(1./3), False
+
+
+def _integrate_many(tasks, n_jobs=1, rtol=1e-3, atol=1e-6):
+    """
+    Maps _one_mass over a list of tasks, optionally across worker processes.
+
+    Parameters:
+        - tasks (list): Tasks as accepted by _one_mass.
+        - n_jobs (int): Number of worker processes; 1 runs serially in this
+          process, -1 uses one process per CPU core.
+        - rtol, atol (float): Local error tolerances, forwarded to _one_mass.
+
+    Returns:
+        - results (list): The _one_mass result for each task, in order.
+
+    Notes:
+        - Each task is independent, so the sweep parallelizes without any
+          shared state; the constraints module is only written by the caller
+          after the results come back.
+    """
+    if n_jobs == 1 or len(tasks) < 2:
+        return [_one_mass(task, rtol, atol) for task in tasks]
+    with multiprocessing.Pool(n_jobs if n_jobs > 0 else None) as pool:
+        return pool.map(functools.partial(_one_mass, rtol=rtol, atol=atol), tasks)
+
+
+def _collect_tasks(idx, M_tot, betas, ln_rho_form, ln_den_end, allow_rel=False):
+    """
+    Builds the _one_mass task list for the masses selected by idx.
+
+    Parameters:
+        - idx (numpy.ndarray): Indices into M_tot of the masses to integrate.
+        - M_tot (numpy.ndarray): The full mass grid.
+        - betas (numpy.ndarray): The beta value for each entry of idx.
+        - ln_rho_form (numpy.ndarray): Log formation density for each entry of M_tot.
+        - ln_den_end (float): Log of the density at the end of the integration.
+        - allow_rel (bool or numpy.ndarray): Whether the relativistic fallback
+          is allowed; either one flag for all masses or a boolean array
+          indexed like M_tot.
+
+    Returns:
+        A tuple (tasks, run_idx):
+            - tasks (list): Task tuples as accepted by _one_mass.
+            - run_idx (list): The index into M_tot behind each task.
+
+    Notes:
+        - Masses that already start at or below ln_den_end are skipped, the
+          same filter every Betas_* loop applied individually before this
+          plumbing was shared.
+    """
+    per_mass = np.ndim(allow_rel) != 0
+    tasks = []
+    run_idx = []
+    for k in range(len(idx)):
+        i = idx[k]
+        if ln_rho_form[i] <= ln_den_end:
+            continue
+        allow = bool(allow_rel[i]) if per_mass else bool(allow_rel)
+        tasks.append((M_tot[i], betas[k], ln_rho_form[i], ln_den_end, allow))
+        run_idx.append(i)
+    return tasks, run_idx
 
 
-		
 def Betas_DM(M_tot):
     """
     Calculates the beta parameter for dark matter constraints given the total mass of dark matter.
@@ -209,42 +379,37 @@ def Betas_DM(M_tot):
     Raises:
         - If there is no primary or relic component, the corresponding arrays will be empty.
     """
+    M_tot = np.asarray(M_tot, dtype=np.float64)
 
-    M_n = []
-    betas_prim = []
-    M_relic = []
-    betas_relic_prim = []
-
-    for i in range(len(M_tot)):
-        if M_tot[i] > 4.1*10**14:
-            M_n.append(M_tot[i])
-            beta = 1.86*10**-18*(M_tot[i]/(10**15))**(1/2)
-            betas_prim.append(beta)
-        elif M_tot[i] < 10**11*constants.M_pl_g:
-            M_relic.append(M_tot[i])
-            beta = 2*10**-28*(M_tot[i]/constants.M_pl_g)**(3/2)
-            betas_relic_prim.append(beta)
-        else:
-            beta = constants.ev1
-        constraints.betas_DM_tot.append(beta/constants.gam_rad**(1/2))
-    
-    betas_prim = np.array(betas_prim)
-    betas_relic_prim = np.array(betas_relic_prim)
-    M_n = np.array(M_n)
-    M_relic = np.array(M_relic)
-    betas = betas_prim/constants.gam_rad**(1/2)
-    betas_relic = betas_relic_prim/constants.gam_rad**(1/2)
+    # Classify the whole mass array at once instead of scanning it in Python
+    mask_prim = M_tot > _M_PRIM
+    mask_relic = M_tot < _M_RELIC_HI
+
+    M_n = M_tot[mask_prim]
+    M_relic = M_tot[mask_relic]
+
+    betas = 1.86e-18*(M_n/1e15)**(1/2)/constants.gam_rad**(1/2)
+    betas_relic = 2e-28*(M_relic/constants.M_pl_g)**(3/2)/constants.gam_rad**(1/2)
+
+    # Full constraint curve: primary formula, relic formula, or ev1 elsewhere
+    beta_full = np.where(mask_prim, 1.86e-18*(M_tot/1e15)**(1/2),
+                np.where(mask_relic, 2e-28*(M_tot/constants.M_pl_g)**(3/2),
+                constants.ev1))
+    constraints.betas_DM_tot = beta_full/constants.gam_rad**(1/2)
 
     return M_n, betas, M_relic, betas_relic
 
     
-def Betas_BBN(M_tot, omega):
+def Betas_BBN(M_tot, omega, n_jobs=1, rtol=1e-3, atol=1e-6, ln_den_end=None):
     """
     Calculates the beta parameters and relic abundances for dark matter particles formed during BBN.
 
     Parameters:
         - M_tot (array-like): The total mass of dark matter, in units of solar masses.
         - omega (float): The baryon-to-photon ratio.
+        - n_jobs (int): Number of worker processes for the mass sweep; 1 (default) runs serially, -1 uses all CPU cores.
+        - rtol, atol (float): Local error tolerances of the per-mass integration; the defaults match scipy's solve_ivp.
+        - ln_den_end (float, optional): Log of the density at which the integrations stop; defaults to np.log(constants.rho_end) evaluated at call time.
 
     Returns:
         - M_bbn (numpy.ndarray): The masses of dark matter particles formed during BBN, in solar masses.
@@ -259,76 +424,74 @@ def Betas_BBN(M_tot, omega):
         - The returned arrays are sorted in increasing order of mass.
     """
 
-    betas_bbn = []
-    M_bbn = []
-    M_bbn_bbn = []
-    Omegas_bbn = []
-    Omegas_bbn_pbbn = []
-    M_bbn_pbbn = []
-
-    rho_form_rad = rho_f(M_tot, omega)
-    j = 0
-    
-    for i in range(len(M_tot)):
-        if M_tot[i]>= constraints.data_mass[0] and M_tot[i]<constraints.data_mass[76]:
-            M_bbn.append(M_tot[i])
-            beta = constraints.data_abundances[j]/constants.gam_rad**(1/2)
-            betas_bbn.append(beta)
-        
-            ln_den_f = np.log(rho_form_rad[i])
-            if ln_den_f <= ln_den_end:
-                continue
-            ln_den = np.linspace(ln_den_f,ln_den_end,10000)
-            sol_try = solve_ivp(diff_rad,(ln_den_f,ln_den_end),np.array([1.,0.]),events=end_evol,t_eval=ln_den,args=(M_tot[i],beta),method = "DOP853")
-            if sol_try.t[-1] > ln_den_end:
-                sol_try = solve_ivp(diff_rad_rel,(ln_den_f,ln_den_end),np.array([1.]),t_eval=ln_den,args=(M_tot[i],beta),method = "DOP853")
-                y = beta*sol_try.y[0][-1]*(constants.M_pl_g/M_tot[i])
-                Omegas_bbn_pbbn.append(y)
-                M_bbn_pbbn.append(M_tot[i])
-            else:
-                Delta_t = constants.t_pl*(M_tot[i]/constants.M_pl_g)**3
-                y = beta*sol_try.y[0][-1]*(1.-sol_try.y[1][-1]/Delta_t)**(1./3)
-                Omegas_bbn.append(y)
-                M_bbn_bbn.append(M_tot[i])
-            j = j+1
-        elif M_tot[i]>= constraints.data_mass[76] and M_tot[i]<2.5*10**13:
-            M_bbn.append(M_tot[i])
-            beta = constraints.data_abundances[76]/constants.gam_rad**(1/2)
-            betas_bbn.append(beta)
-        
-            ln_den_f = np.log(rho_form_rad[i])
-            if ln_den_f <= ln_den_end:
-                continue
-            ln_den = np.linspace(ln_den_f,ln_den_end,10000)
-            sol_try = solve_ivp(diff_rad,(ln_den_f,ln_den_end),np.array([1.,0.]),events=end_evol,t_eval=ln_den,args=(M_tot[i],beta),method = "DOP853")
-            Delta_t = constants.t_pl*(M_tot[i]/constants.M_pl_g)**3
-            y = beta*sol_try.y[0][-1]*(1.-sol_try.y[1][-1]/Delta_t)**(1./3)
-            Omegas_bbn.append(y)
-            M_bbn_bbn.append(M_tot[i])
-            j = j+1
+    # Resolve the end of the integration at call time, so that a runtime
+    # change of constants.rho_end is picked up instead of a stale module value
+    if ln_den_end is None:
+        ln_den_end = np.log(constants.rho_end)
+    M_tot = np.asarray(M_tot, dtype=np.float64)
+    sqrt_gam = constants.gam_rad**(1/2)
+    # Cache the formation densities (and their logs) for the whole array once
+    ln_rho_form = np.log(rho_f(M_tot, omega))
+
+    # Classify the whole mass array at once
+    mask_lo = (M_tot >= _M_BBN_LO) & (M_tot < _M_BBN_HI)
+    mask_hi = (M_tot >= _M_BBN_HI) & (M_tot < _M_PBBN_HI)
+    mask_bbn = mask_lo | mask_hi
+
+    # Betas: the tabulated abundances are walked in mass order over the low
+    # window, the last tabulated value covers the high window
+    data_abundances = np.asarray(constraints.data_abundances)
+    n_lo = int(np.count_nonzero(mask_lo))
+    M_bbn = M_tot[mask_bbn]
+    betas_bbn = np.empty(len(M_bbn))
+    betas_bbn[:n_lo] = data_abundances[:n_lo]/sqrt_gam
+    betas_bbn[n_lo:] = data_abundances[76]/sqrt_gam
+
+    # Preallocate the full-grid constraint arrays and the per-regime outputs
+    betas_BBN_tot = np.full(len(M_tot), constants.ev1, dtype=np.float64)
+    betas_BBN_tot[mask_bbn] = betas_bbn
+    Omega_BBN_tot = np.full(len(M_tot), constants.ev2, dtype=np.float64)
+
+    n_bbn = len(M_bbn)
+    M_bbn_bbn = np.empty(n_bbn)
+    Omegas_bbn = np.empty(n_bbn)
+    M_bbn_pbbn = np.empty(n_bbn)
+    Omegas_bbn_pbbn = np.empty(n_bbn)
+    n_rad = 0
+    n_rel = 0
+
+    idx_bbn = np.flatnonzero(mask_bbn)
+    tasks, run_idx = _collect_tasks(idx_bbn, M_tot, betas_bbn, ln_rho_form,
+                                    ln_den_end, allow_rel=mask_lo)
+
+    for i, (y, went_rel) in zip(run_idx, _integrate_many(tasks, n_jobs, rtol, atol)):
+        if went_rel:
+            M_bbn_pbbn[n_rel] = M_tot[i]
+            Omegas_bbn_pbbn[n_rel] = y
+            n_rel = n_rel+1
         else:
-            beta = constants.ev1
-            y = constants.ev2
-        constraints.betas_BBN_tot.append(beta)
-        constraints.Omega_BBN_tot.append(y)
-    
-    betas_bbn = np.array(betas_bbn)
-    M_bbn = np.array(M_bbn)
-    M_bbn_bbn = np.array(M_bbn_bbn)
-    M_bbn_pbbn = np.array(M_bbn_pbbn)
-    Omegas_bbn = np.array(Omegas_bbn)
-    Omegas_bbn_pbbn = np.array(Omegas_bbn_pbbn)
-    
-    return M_bbn, betas_bbn, M_bbn_bbn, M_bbn_pbbn, Omegas_bbn, Omegas_bbn_pbbn
+            M_bbn_bbn[n_rad] = M_tot[i]
+            Omegas_bbn[n_rad] = y
+            n_rad = n_rad+1
+        Omega_BBN_tot[i] = y
 
+    constraints.betas_BBN_tot = betas_BBN_tot
+    constraints.Omega_BBN_tot = Omega_BBN_tot
 
-def Betas_SD(M_tot, omega):
+    return (M_bbn, betas_bbn, M_bbn_bbn[:n_rad], M_bbn_pbbn[:n_rel],
+            Omegas_bbn[:n_rad], Omegas_bbn_pbbn[:n_rel])
+
+
+def Betas_SD(M_tot, omega, n_jobs=1, rtol=1e-3, atol=1e-6, ln_den_end=None):
     """
     Calculates the beta parameters and relic abundances for self-destructive dark matter particles.
 
     Parameters:
         - M_tot (array-like): The total mass of dark matter, in units of solar masses.
         - omega (float): The baryon-to-photon ratio.
+        - n_jobs (int): Number of worker processes for the mass sweep; 1 (default) runs serially, -1 uses all CPU cores.
+        - rtol, atol (float): Local error tolerances of the per-mass integration; the defaults match scipy's solve_ivp.
+        - ln_den_end (float, optional): Log of the density at which the integrations stop; defaults to np.log(constants.rho_end) evaluated at call time.
 
     Returns:
         - M_sd (numpy.ndarray): The masses of self-destructive dark matter particles, in solar masses.
@@ -344,50 +507,53 @@ def Betas_SD(M_tot, omega):
         - The relic abundances are calculated using the DOP853 solver from the Scipy library.
     """
     
-    betas_sd = []
-    M_sd = []
-    M_sd_bbn = []
-    Omegas_sd = []
-    
-    rho_form_rad = rho_f(M_tot, omega)
-
-    for i in range(len(M_tot)):
-        if M_tot[i]> 10**11 and M_tot[i]<10**13:
-            M_sd.append(M_tot[i])
-            beta = 10**(-21)/constants.gam_rad**(1/2)
-            betas_sd.append(beta)
-        
-            ln_den_f = np.log(rho_form_rad[i])
-            if ln_den_f <= ln_den_end:
-                continue
-            ln_den = np.linspace(ln_den_f,ln_den_end,10000)
-            sol_try = solve_ivp(diff_rad,(ln_den_f,ln_den_end),np.array([1.,0.]),events=end_evol,t_eval=ln_den,args=(M_tot[i],beta),method = "DOP853")
-            Delta_t = constants.t_pl*(M_tot[i]/constants.M_pl_g)**3
-            y = beta*sol_try.y[0][-1]*(1.-sol_try.y[1][-1]/Delta_t)**(1./3)
-            Omegas_sd.append(y)
-            M_sd_bbn.append(M_tot[i])
-        else:
-            beta = constants.ev1
-            y = constants.ev2
-        constraints.betas_SD_tot.append(beta)
-        constraints.Omega_SD_tot.append(y)
-    
-    betas_sd = np.array(betas_sd)
-    M_sd = np.array(M_sd)
-    M_sd_bbn = np.array(M_sd_bbn)
-    Omegas_sd = np.array(Omegas_sd)
-    
-    return M_sd, betas_sd, M_sd_bbn, Omegas_sd
+    # Resolve the end of the integration at call time, so that a runtime
+    # change of constants.rho_end is picked up instead of a stale module value
+    if ln_den_end is None:
+        ln_den_end = np.log(constants.rho_end)
+    M_tot = np.asarray(M_tot, dtype=np.float64)
+    sqrt_gam = constants.gam_rad**(1/2)
+    # Cache the formation densities (and their logs) for the whole array once
+    ln_rho_form = np.log(rho_f(M_tot, omega))
+
+    mask_sd = (M_tot > _M_SD_LO) & (M_tot < _M_SD_HI)
+    M_sd = M_tot[mask_sd]
+    betas_sd = np.full(len(M_sd), 1e-21/sqrt_gam)
+
+    betas_SD_tot = np.full(len(M_tot), constants.ev1, dtype=np.float64)
+    betas_SD_tot[mask_sd] = betas_sd
+    Omega_SD_tot = np.full(len(M_tot), constants.ev2, dtype=np.float64)
+
+    M_sd_bbn = np.empty(len(M_sd))
+    Omegas_sd = np.empty(len(M_sd))
+    n_sd = 0
+
+    idx_sd = np.flatnonzero(mask_sd)
+    tasks, run_idx = _collect_tasks(idx_sd, M_tot, betas_sd, ln_rho_form, ln_den_end)
 
+    for i, (y, went_rel) in zip(run_idx, _integrate_many(tasks, n_jobs, rtol, atol)):
+        M_sd_bbn[n_sd] = M_tot[i]
+        Omegas_sd[n_sd] = y
+        n_sd = n_sd+1
+        Omega_SD_tot[i] = y
 
+    constraints.betas_SD_tot = betas_SD_tot
+    constraints.Omega_SD_tot = Omega_SD_tot
 
-def Betas_CMB_AN(M_tot, omega):
+    return M_sd, betas_sd, M_sd_bbn[:n_sd], Omegas_sd[:n_sd]
+
+
+
+def Betas_CMB_AN(M_tot, omega, n_jobs=1, rtol=1e-3, atol=1e-6, ln_den_end=None):
     """
     Calculates the beta parameters and relic abundances for dark matter particles formed during CMB-era annihilation.
 
     Parameters:
         - M_tot (array-like): The total mass of dark matter, in units of solar masses.
         - omega (float): The present-day density of baryons relative to the critical density.
+        - n_jobs (int): Number of worker processes for the mass sweep; 1 (default) runs serially, -1 uses all CPU cores.
+        - rtol, atol (float): Local error tolerances of the per-mass integration; the defaults match scipy's solve_ivp.
+        - ln_den_end (float, optional): Log of the density at which the integrations stop; defaults to np.log(constants.rho_end) evaluated at call time.
 
     Returns:
         - M_an (numpy.ndarray): The masses of dark matter particles formed during CMB-era annihilation, in solar masses.
@@ -402,49 +568,52 @@ def Betas_CMB_AN(M_tot, omega):
         - The beta parameter values and relic abundances are calculated assuming the "slow-rollover" approximation for freeze-out.
     """
 
-    betas_an = []
-    M_an = []
-    M_an_bbn = []
-    Omegas_an = []
-    
-    rho_form_rad = rho_f(M_tot, omega)
-
-    for i in range(len(M_tot)):
-        if M_tot[i]> 2.5*10**13 and M_tot[i]<2.4*10**14:
-            M_an.append(M_tot[i])
-            beta = 3*10**(-30)*(M_tot[i]/10**13)**3.1/constants.gam_rad**(1/2)
-            betas_an.append(beta)
-        
-            ln_den_f = np.log(rho_form_rad[i])
-            if ln_den_f <= ln_den_end:
-                continue
-            ln_den = np.linspace(ln_den_f,ln_den_end,10000)
-            sol_try = solve_ivp(diff_rad,(ln_den_f,ln_den_end),np.array([1.,0.]),events=end_evol,t_eval=ln_den,args=(M_tot[i],beta),method = "DOP853")
-            Delta_t = constants.t_pl*(M_tot[i]/constants.M_pl_g)**3
-            y = beta*sol_try.y[0][-1]*(1.-sol_try.y[1][-1]/Delta_t)**(1./3)
-            Omegas_an.append(y)
-            M_an_bbn.append(M_tot[i])
-        else:
-            beta = constants.ev1
-            y = constants.ev2
-        constraints.betas_CMB_AN_tot.append(beta)
-        constraints.Omega_CMB_AN_tot.append(y)
-    
-    betas_an = np.array(betas_an)
-    M_an = np.array(M_an)
-    M_an_bbn = np.array(M_an_bbn)
-    Omegas_an = np.array(Omegas_an)
-    
-    return M_an, betas_an, M_an_bbn, Omegas_an
+    # Resolve the end of the integration at call time, so that a runtime
+    # change of constants.rho_end is picked up instead of a stale module value
+    if ln_den_end is None:
+        ln_den_end = np.log(constants.rho_end)
+    M_tot = np.asarray(M_tot, dtype=np.float64)
+    sqrt_gam = constants.gam_rad**(1/2)
+    # Cache the formation densities (and their logs) for the whole array once
+    ln_rho_form = np.log(rho_f(M_tot, omega))
+
+    mask_an = (M_tot > _M_AN_LO) & (M_tot < _M_AN_HI)
+    M_an = M_tot[mask_an]
+    betas_an = 3*10**(-30)*(M_an/1e13)**3.1/sqrt_gam
+
+    betas_CMB_AN_tot = np.full(len(M_tot), constants.ev1, dtype=np.float64)
+    betas_CMB_AN_tot[mask_an] = betas_an
+    Omega_CMB_AN_tot = np.full(len(M_tot), constants.ev2, dtype=np.float64)
+
+    M_an_bbn = np.empty(len(M_an))
+    Omegas_an = np.empty(len(M_an))
+    n_an = 0
+
+    idx_an = np.flatnonzero(mask_an)
+    tasks, run_idx = _collect_tasks(idx_an, M_tot, betas_an, ln_rho_form, ln_den_end)
+
+    for i, (y, went_rel) in zip(run_idx, _integrate_many(tasks, n_jobs, rtol, atol)):
+        M_an_bbn[n_an] = M_tot[i]
+        Omegas_an[n_an] = y
+        n_an = n_an+1
+        Omega_CMB_AN_tot[i] = y
+
+    constraints.betas_CMB_AN_tot = betas_CMB_AN_tot
+    constraints.Omega_CMB_AN_tot = Omega_CMB_AN_tot
 
+    return M_an, betas_an, M_an_bbn[:n_an], Omegas_an[:n_an]
 
-def Betas_GRB(M_tot, omega):
+
+def Betas_GRB(M_tot, omega, n_jobs=1, rtol=1e-3, atol=1e-6, ln_den_end=None):
     """
     Calculates the beta parameters and relic abundances for dark matter particles formed during the GRB epoch.
 
     Parameters:
         - M_tot (array-like): The total mass of dark matter, in units of solar masses.
         - omega (float): The baryon-to-photon ratio.
+        - n_jobs (int): Number of worker processes for the mass sweep; 1 (default) runs serially, -1 uses all CPU cores.
+        - rtol, atol (float): Local error tolerances of the per-mass integration; the defaults match scipy's solve_ivp.
+        - ln_den_end (float, optional): Log of the density at which the integrations stop; defaults to np.log(constants.rho_end) evaluated at call time.
     
     Returns:
         - M_grb1 (numpy.ndarray): The masses of dark matter particles formed during the first GRB epoch, in solar masses.
@@ -463,67 +632,58 @@ def Betas_GRB(M_tot, omega):
         - The values for beta and relic abundance for M_tot outside the range (3e13, 7e16) solar masses are set to constants.ev1 and constants.ev2 respectively.
     """
 
-    betas_grb1 = []
-    M_grb1 = []
-    betas_grb2 = []
-    M_grb2 = []
-
-    M_grb1_bbn = []
-    Omegas_grb1 = []
-    M_grb2_bbn = []
-    Omegas_grb2 = []
-    
-    rho_form_rad = rho_f(M_tot, omega)
-
-    for i in range(len(M_tot)):
-        if M_tot[i]> 3*10**13 and M_tot[i]<4.1*10**14:
-            M_grb1.append(M_tot[i])
-            beta = 5*10**(-28)*(M_tot[i]/(4.1*10**14))**-3.3/constants.gam_rad**(1/2)
-            betas_grb1.append(beta)
-        
-            ln_den_f = np.log(rho_form_rad[i])
-            if ln_den_f <= ln_den_end:
-                continue
-            ln_den = np.linspace(ln_den_f,ln_den_end,10000)
-            sol_try = solve_ivp(diff_rad,(ln_den_f,ln_den_end),np.array([1.,0.]),events=end_evol,t_eval=ln_den,args=(M_tot[i],beta),method = "DOP853")
-            Delta_t = constants.t_pl*(M_tot[i]/constants.M_pl_g)**3
-            y = beta*sol_try.y[0][-1]*(1.-sol_try.y[1][-1]/Delta_t)**(1./3)
-            Omegas_grb1.append(y)
-            M_grb1_bbn.append(M_tot[i])
-        
-        elif M_tot[i]> 4.1*10**14 and M_tot[i]<7*10**16:
-            M_grb2.append(M_tot[i])
-            beta = 5*10**(-26)*(M_tot[i]/(4.1*10**14))**3.9/constants.gam_rad**(1/2)
-            betas_grb2.append(beta)
-        
-            ln_den_f = np.log(rho_form_rad[i])
-            if ln_den_f <= ln_den_end:
-                continue
-            ln_den = np.linspace(ln_den_f,ln_den_end,10000)
-            sol_try = solve_ivp(diff_rad,(ln_den_f,ln_den_end),np.array([1.,0.]),events=end_evol,t_eval=ln_den,args=(M_tot[i],beta),method = "DOP853")
-            Delta_t = constants.t_pl*(M_tot[i]/constants.M_pl_g)**3
-            y = beta*sol_try.y[0][-1]*(1.-sol_try.y[1][-1]/Delta_t)**(1./3)
-            Omegas_grb2.append(y)
-            M_grb2_bbn.append(M_tot[i])
+    # Resolve the end of the integration at call time, so that a runtime
+    # change of constants.rho_end is picked up instead of a stale module value
+    if ln_den_end is None:
+        ln_den_end = np.log(constants.rho_end)
+    M_tot = np.asarray(M_tot, dtype=np.float64)
+    sqrt_gam = constants.gam_rad**(1/2)
+    # Cache the formation densities (and their logs) for the whole array once
+    ln_rho_form = np.log(rho_f(M_tot, omega))
+
+    mask_grb1 = (M_tot > _M_GRB_LO) & (M_tot < _M_PRIM)
+    mask_grb2 = (M_tot > _M_PRIM) & (M_tot < _M_GRB_HI)
+    mask_grb = mask_grb1 | mask_grb2
+
+    M_grb1 = M_tot[mask_grb1]
+    M_grb2 = M_tot[mask_grb2]
+    betas_grb1 = 5e-28*(M_grb1/_M_PRIM)**-3.3/sqrt_gam
+    betas_grb2 = 5e-26*(M_grb2/_M_PRIM)**3.9/sqrt_gam
+
+    betas_GRB_tot = np.full(len(M_tot), constants.ev1, dtype=np.float64)
+    betas_GRB_tot[mask_grb1] = betas_grb1
+    betas_GRB_tot[mask_grb2] = betas_grb2
+    Omega_GRB_tot = np.full(len(M_tot), constants.ev2, dtype=np.float64)
+
+    M_grb1_bbn = np.empty(len(M_grb1))
+    Omegas_grb1 = np.empty(len(M_grb1))
+    M_grb2_bbn = np.empty(len(M_grb2))
+    Omegas_grb2 = np.empty(len(M_grb2))
+    n_grb1 = 0
+    n_grb2 = 0
+
+    idx_grb = np.flatnonzero(mask_grb)
+    tasks, run_idx = _collect_tasks(idx_grb, M_tot, betas_GRB_tot[idx_grb],
+                                    ln_rho_form, ln_den_end)
+
+    for i, (y, went_rel) in zip(run_idx, _integrate_many(tasks, n_jobs, rtol, atol)):
+        if mask_grb1[i]:
+            M_grb1_bbn[n_grb1] = M_tot[i]
+            Omegas_grb1[n_grb1] = y
+            n_grb1 = n_grb1+1
         else:
-            beta = constants.ev1
-            y = constants.ev2
-        constraints.betas_GRB_tot.append(beta)
-        constraints.Omega_GRB_tot.append(y)
-    
-    betas_grb1 = np.array(betas_grb1)
-    M_grb1 = np.array(M_grb1)
-    betas_grb2 = np.array(betas_grb2)
-    M_grn2 = np.array(M_grb2)
-    M_grb1_bbn = np.array(M_grb1_bbn)
-    Omegas_grb1 = np.array(Omegas_grb1)
-    M_grb2_bbn = np.array(M_grb2_bbn)
-    Omegas_grb2 = np.array(Omegas_grb2)
+            M_grb2_bbn[n_grb2] = M_tot[i]
+            Omegas_grb2[n_grb2] = y
+            n_grb2 = n_grb2+1
+        Omega_GRB_tot[i] = y
 
-    
-    return M_grb1, M_grb2, betas_grb1, betas_grb2, M_grb1_bbn, M_grb2_bbn, Omegas_grb1, Omegas_grb2
+    constraints.betas_GRB_tot = betas_GRB_tot
+    constraints.Omega_GRB_tot = Omega_GRB_tot
+
+    return (M_grb1, M_grb2, betas_grb1, betas_grb2, M_grb1_bbn[:n_grb1],
+            M_grb2_bbn[:n_grb2], Omegas_grb1[:n_grb1], Omegas_grb2[:n_grb2])
 
-def Betas_Reio(M_tot, omega):
+def Betas_Reio(M_tot, omega, n_jobs=1, rtol=1e-3, atol=1e-6, ln_den_end=None):
 
     """
     Calculates the beta parameters and relic abundances for dark matter particles formed during reionization epoch.
@@ -531,6 +691,9 @@ def Betas_Reio(M_tot, omega):
     Parameters:
         - M_tot (array-like): The total mass of dark matter, in units of solar masses.
         - omega (float): The baryon-to-photon ratio.
+        - n_jobs (int): Number of worker processes for the mass sweep; 1 (default) runs serially, -1 uses all CPU cores.
+        - rtol, atol (float): Local error tolerances of the per-mass integration; the defaults match scipy's solve_ivp.
+        - ln_den_end (float, optional): Log of the density at which the integrations stop; defaults to np.log(constants.rho_end) evaluated at call time.
 
     Returns:
         - M_reio (numpy.ndarray): The masses of dark matter particles formed during reionization epoch, in solar masses.
@@ -544,41 +707,40 @@ def Betas_Reio(M_tot, omega):
         - The function uses numerical integration to calculate the relic abundances.
         - The values for beta and relic abundance for M_tot outside the range (1e15, 1e17) solar masses are set to constants.ev1 and constants.ev2 respectively.
     """
-    betas_reio = []
-    M_reio = []
+    # Resolve the end of the integration at call time, so that a runtime
+    # change of constants.rho_end is picked up instead of a stale module value
+    if ln_den_end is None:
+        ln_den_end = np.log(constants.rho_end)
+    M_tot = np.asarray(M_tot, dtype=np.float64)
+    sqrt_gam = constants.gam_rad**(1/2)
+    # Cache the formation densities (and their logs) for the whole array once
+    ln_rho_form = np.log(rho_f(M_tot, omega))
 
-    M_reio_bbn = []
-    Omegas_reio = []
-    
-    rho_form_rad = rho_f(M_tot, omega)
-
-    for i in range(len(M_tot)):
-        if M_tot[i]> 10**15 and M_tot[i]<10**17:
-            M_reio.append(M_tot[i])
-            beta = 2.4*10**(-26)*(M_tot[i]/(4.1*10**14))**4.3/constants.gam_rad**(1/2)
-            betas_reio.append(beta)
-        
-            ln_den_f = np.log(rho_form_rad[i])
-            if ln_den_f <= ln_den_end:
-                continue
-            ln_den = np.linspace(ln_den_f,ln_den_end,10000)
-            sol_try = solve_ivp(diff_rad,(ln_den_f,ln_den_end),np.array([1.,0.]),events=end_evol,t_eval=ln_den,args=(M_tot[i],beta),method = "DOP853")
-            Delta_t = constants.t_pl*(M_tot[i]/constants.M_pl_g)**3
-            y = beta*sol_try.y[0][-1]*(1.-sol_try.y[1][-1]/Delta_t)**(1./3)
-            Omegas_reio.append(y)
-            M_reio_bbn.append(M_tot[i])
-        else:
-            beta = constants.ev1
-            y = constants.ev2
-        constraints.betas_Reio_tot.append(beta)
-        constraints.Omega_Reio_tot.append(y)
-    
-    betas_reio = np.array(betas_reio)
-    M_reio = np.array(M_reio)
-    M_reio_bbn = np.array(M_reio_bbn)
-    Omegas_reio = np.array(Omegas_reio)
-    
-    return M_reio, betas_reio, M_reio_bbn, Omegas_reio
+    mask_reio = (M_tot > _M_REIO_LO) & (M_tot < _M_REIO_HI)
+    M_reio = M_tot[mask_reio]
+    betas_reio = 2.4e-26*(M_reio/_M_PRIM)**4.3/sqrt_gam
+
+    betas_Reio_tot = np.full(len(M_tot), constants.ev1, dtype=np.float64)
+    betas_Reio_tot[mask_reio] = betas_reio
+    Omega_Reio_tot = np.full(len(M_tot), constants.ev2, dtype=np.float64)
+
+    M_reio_bbn = np.empty(len(M_reio))
+    Omegas_reio = np.empty(len(M_reio))
+    n_reio = 0
+
+    idx_reio = np.flatnonzero(mask_reio)
+    tasks, run_idx = _collect_tasks(idx_reio, M_tot, betas_reio, ln_rho_form, ln_den_end)
+
+    for i, (y, went_rel) in zip(run_idx, _integrate_many(tasks, n_jobs, rtol, atol)):
+        M_reio_bbn[n_reio] = M_tot[i]
+        Omegas_reio[n_reio] = y
+        n_reio = n_reio+1
+        Omega_Reio_tot[i] = y
+
+    constraints.betas_Reio_tot = betas_Reio_tot
+    constraints.Omega_Reio_tot = Omega_Reio_tot
+
+    return M_reio, betas_reio, M_reio_bbn[:n_reio], Omegas_reio[:n_reio]
 
 def Betas_LSP(M_tot):
     """
@@ -596,59 +758,60 @@ def Betas_LSP(M_tot):
         - The returned arrays are sorted in increasing order of mass.
         - The values for beta for M_tot outside the range (0, 1e11) solar masses are set to constants.ev1.
     """
+    M_tot = np.asarray(M_tot, dtype=np.float64)
+    sqrt_gam = constants.gam_rad**(1/2)
+
+    mask_lsp = M_tot < _M_LSP_HI
+    M_lsp = M_tot[mask_lsp]
+    betas_lsp = 1e-18*(M_lsp/_M_LSP_HI)**(-1/2)/sqrt_gam
+
+    constraints.betas_LSP_tot = np.where(
+        mask_lsp, 1e-18*(M_tot/_M_LSP_HI)**(-1/2)/constants.gam_rad**(1/2),
+        constants.ev1)
 
-    betas_lsp = []
-    M_lsp = []
-    
-    for i in range(len(M_tot)):
-        if M_tot[i]< 10**11:
-            M_lsp.append(M_tot[i])
-            beta = 10**(-18)*(M_tot[i]/(10**11))**(-1/2)/constants.gam_rad**(1/2)
-            betas_lsp.append(beta)
-        else:
-            beta = constants.ev1
-        constraints.betas_LSP_tot.append(beta)
-    
-    betas_lsp = np.array(betas_lsp)
-    M_lsp = np.array(M_lsp)
-    
     return M_lsp, betas_lsp
 
-def Omegas_LSP(M_tot, omega):
-    M_lsp_bbn = []
-    Omegas_lsp = []
-    M_lsp_pbbn = []
-    Omegas_lsp_pbbn = []
-    
-    rho_form_rad = rho_f(M_tot, omega)
-    
-    for i in range(len(M_tot)):
-        if M_tot[i]<1e11:
-            beta = 1e-18*(M_tot[i]/1e11)**(-1/2)/constants.gam_rad**(1/2)
-            ln_den_f = np.log(rho_form_rad[i])
-            if ln_den_f <= ln_den_end:
-                continue
-            ln_den = np.linspace(ln_den_f,ln_den_end,10000)
-            sol_try = solve_ivp(diff_rad,(ln_den_f,ln_den_end),np.array([1.,0.]),events=end_evol,t_eval=ln_den,args=(M_tot[i],beta),method = "DOP853")
-            if sol_try.t[-1] > ln_den_end:
-                sol_try = solve_ivp(diff_rad_rel,(ln_den_f,ln_den_end),np.array([1.]),t_eval=ln_den,args=(M_tot[i],beta),method = "DOP853")
-                y = beta*sol_try.y[0][-1]*(constants.M_pl_g/M_tot[i])
-                Omegas_lsp_pbbn.append(y)
-                M_lsp_pbbn.append(M_tot[i])
-            else:
-                Delta_t = t_pl*(M_tot[i]/constants.M_pl_g)**3
-                y = beta*sol_try.y[0][-1]*(1.-sol_try.y[1][-1]/Delta_t)**(1./3)
-                Omegas_lsp.append(y)
-                M_lsp_bbn.append(M_tot[i])
+def Omegas_LSP(M_tot, omega, n_jobs=1, rtol=1e-3, atol=1e-6, ln_den_end=None):
+    # Resolve the end of the integration at call time, so that a runtime
+    # change of constants.rho_end is picked up instead of a stale module value
+    if ln_den_end is None:
+        ln_den_end = np.log(constants.rho_end)
+    M_tot = np.asarray(M_tot, dtype=np.float64)
+    sqrt_gam = constants.gam_rad**(1/2)
+    # Cache the formation densities (and their logs) for the whole array once
+    ln_rho_form = np.log(rho_f(M_tot, omega))
+
+    mask_lsp = M_tot < _M_LSP_HI
+    betas_lsp = 1e-18*(M_tot[mask_lsp]/_M_LSP_HI)**(-1/2)/sqrt_gam
+
+    Omega_LSP_tot = np.full(len(M_tot), constants.ev2, dtype=np.float64)
+
+    n_lsp = int(np.count_nonzero(mask_lsp))
+    M_lsp_bbn = np.empty(n_lsp)
+    Omegas_lsp = np.empty(n_lsp)
+    M_lsp_pbbn = np.empty(n_lsp)
+    Omegas_lsp_pbbn = np.empty(n_lsp)
+    n_rad = 0
+    n_rel = 0
+
+    idx_lsp = np.flatnonzero(mask_lsp)
+    tasks, run_idx = _collect_tasks(idx_lsp, M_tot, betas_lsp, ln_rho_form,
+                                    ln_den_end, allow_rel=True)
+
+    for i, (y, went_rel) in zip(run_idx, _integrate_many(tasks, n_jobs, rtol, atol)):
+        if went_rel:
+            M_lsp_pbbn[n_rel] = M_tot[i]
+            Omegas_lsp_pbbn[n_rel] = y
+            n_rel = n_rel+1
         else:
-            y = constants.ev2
-            constraints.Omega_SD_tot.append(y)
-            
-    M_lsp_bbn = np.array(M_lsp_bbn)
-    Omegas_lsp = np.array(Omegas_lsp)
-    M_lsp_pbbn = np.array(M_lsp_pbbn)
-    Omegas_lsp_pbbn = np.array(Omegas_lsp_pbbn)
-    return M_lsp_bbn, Omegas_lsp, M_lsp_pbbn, Omegas_lsp_pbbn
+            M_lsp_bbn[n_rad] = M_tot[i]
+            Omegas_lsp[n_rad] = y
+            n_rad = n_rad+1
+        Omega_LSP_tot[i] = y
+
+    constraints.Omega_LSP_tot = Omega_LSP_tot
+
+    return M_lsp_bbn[:n_rad], Omegas_lsp[:n_rad], M_lsp_pbbn[:n_rel], Omegas_lsp_pbbn[:n_rel]
 
 def get_Betas_full(M_tot):
 
@@ -664,14 +827,14 @@ def get_Betas_full(M_tot):
     Notes:
         - The function calculates the minimum beta parameter value for each dark matter particle mass by comparing the beta parameter values obtained from different astrophysical constraints: DM halos, BBN, self-interaction, CMB, GRBs, reionization, and LSP.
     """
-    DM_tot = np.array(constraints.betas_DM_tot)
-    BBN_tot = np.array(constraints.betas_BBN_tot)
-    SD_tot = np.array(constraints.betas_SD_tot)
-    CMB_tot = np.array(constraints.betas_CMB_AN_tot)
-    GRB_tot = np.array(constraints.betas_GRB_tot)
-    Reio_tot = np.array(constraints.betas_Reio_tot)
-    LSP_tot = np.array(constraints.betas_LSP_tot)
-    constraints.betas_full = M_tot*0
-    for i in range(len(M_tot)):
-        constraints.betas_full[i] = min(DM_tot[i], BBN_tot[i], SD_tot[i], CMB_tot[i], GRB_tot[i], Reio_tot[i], LSP_tot[i])
+    all_tot = np.stack([np.asarray(constraints.betas_DM_tot, dtype=np.float64),
+                        np.asarray(constraints.betas_BBN_tot, dtype=np.float64),
+                        np.asarray(constraints.betas_SD_tot, dtype=np.float64),
+                        np.asarray(constraints.betas_CMB_AN_tot, dtype=np.float64),
+                        np.asarray(constraints.betas_GRB_tot, dtype=np.float64),
+                        np.asarray(constraints.betas_Reio_tot, dtype=np.float64),
+                        np.asarray(constraints.betas_LSP_tot, dtype=np.float64)])
+    if all_tot.shape[1] != len(M_tot):
+        raise ValueError("The beta constraint arrays do not match the mass array; run the Betas_* functions on this M_tot first")
+    constraints.betas_full = np.minimum.reduce(all_tot, axis=0)
     return constraints.betas_full
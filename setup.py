@@ -1,40 +1,51 @@
-import pathlib
 from setuptools import find_packages, setup
 
-HERE = pathlib.Path(__file__).parent
-
-VERSION = '0.1' 
-PACKAGE_NAME = 'betaPBH' 
+VERSION = '0.1'
+PACKAGE_NAME = 'betaPBH'
 
 URL = 'https://github.com/TadeoDGAguilar'
 
-LICENSE = 'GPL-2.0' 
+LICENSE = 'GPL-2.0'
 
 DESCRIPTION = 'Library to compute abundances to PBHs in different scenarios on Early Universe' #Descripción corta
 
-LONG_DESCRIPTION = (HERE / "README.md").read_text(encoding='utf-8') 
-
-LONG_DESC_TYPE = "text/markdown"
+# The long description lives in setup.cfg as `long_description = file: README.md`,
+# so the README is only read when wheel/sdist metadata is actually generated
 
 
+# Lower bounds chosen so the resolver always lands on manylinux wheels
+# (no source builds) and on scipy's lazy subpackage behaviour
 INSTALL_REQUIRES = [
-      'matplotlib',
-      'numpy',
-      'scipy',
+      'numpy>=1.22',
+      'scipy>=1.8',
       ]
 
+# Optional extras: the numeric core only needs numpy and scipy, so
+# matplotlib (plotting only) and numba (faster integration driver) are
+# opt-in instead of forced on every install
+EXTRAS_REQUIRE = {
+      'plot': ['matplotlib>=3.5'],
+      'fast': ['numba'],
+      'dev': ['pytest', 'build'],
+      }
+
 setup(
     name=PACKAGE_NAME,
     version=VERSION,
     description=DESCRIPTION,
-    long_description=LONG_DESCRIPTION,
-    long_description_content_type=LONG_DESC_TYPE,
-    author=['Tadeo D. GA', 'Luis E. PA'],
+    author='Tadeo D. Gómez Aguilar, Luis E. Padilla',
     maintainer = 'Tadeo D. Gómez Aguilar',
     maintainer_email = 'tadeo.daguilar@gmail.com',
     url=URL,
     install_requires=INSTALL_REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
+    python_requires='>=3.9',
     license=LICENSE,
-    packages=find_packages(),
-    include_package_data=True
+    classifiers=[
+        'Programming Language :: Python :: 3',
+        'Operating System :: OS Independent',
+    ],
+    packages=find_packages(include=['betaPBH', 'betaPBH.*']),
+    include_package_data=True,
+    zip_safe=False
 )